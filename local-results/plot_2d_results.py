@@ -1,66 +1,78 @@
 #!/usr/bin/env python3
-import csv
 import sys
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 import numpy as np
+import pandas as pd
 
-# Usage: ./plot_2d_results.py <csv_file> [title]
-if len(sys.argv) < 2:
-    print("Usage: ./plot_2d_results.py <csv_file> [title]")
-    sys.exit(1)
 
-csv_file = sys.argv[1]
-title = sys.argv[2] if len(sys.argv) > 2 else csv_file.replace('.csv', '')
-output_file = csv_file.replace('.csv', '.png')
+def main(csv_path, title=None, output=None):
+    if title is None:
+        title = csv_path.replace('.csv', '')
+    if output is None:
+        output = csv_path.replace('.csv', '.png')
 
-# Read data
-data = []
-with open(csv_file, 'r') as f:
-    reader = csv.DictReader(f)
-    for row in reader:
-        data.append({
-            'concurrency': int(row['concurrency']),
-            'pool_size': int(row['pool_size']),
-            'tps': float(row['tps'])
-        })
+    # Read data
+    df = pd.read_csv(csv_path, usecols=['concurrency', 'pool_size', 'tps'],
+                     dtype={'concurrency': 'int32', 'pool_size': 'int32', 'tps': 'float64'},
+                     engine='c')
 
-# Find best
-best = max(data, key=lambda x: x['tps'])
+    # Find best
+    best = df.loc[df['tps'].idxmax()]
+    best_concurrency = int(best['concurrency'])
+    best_pool_size = int(best['pool_size'])
+    best_tps = float(best['tps'])
 
-# Get unique pool sizes
-pool_sizes = sorted(set(d['pool_size'] for d in data))
+    # Group by pool size, sorted once by (pool_size, concurrency)
+    grouped = df.sort_values(['pool_size', 'concurrency']).groupby('pool_size', sort=True)
 
-# Create figure
-fig, ax = plt.subplots(figsize=(12, 7))
+    # Create figure
+    fig, ax = plt.subplots(figsize=(12, 7), layout='constrained')
 
-# Color map for pool sizes
-colors = plt.cm.viridis(np.linspace(0, 1, len(pool_sizes)))
+    # Color map for pool sizes, as an (n_pools, 4) RGBA array
+    colors = plt.cm.viridis(np.linspace(0, 1, grouped.ngroups))
 
-# Plot each pool size as a separate line
-for i, pool_size in enumerate(pool_sizes):
-    subset = [(d['concurrency'], d['tps']) for d in data if d['pool_size'] == pool_size]
-    subset.sort()
-    if subset:
-        conc, tps = zip(*subset)
-        ax.scatter(conc, tps, c=[colors[i]], s=50, label=f'pool={pool_size}', alpha=0.7)
+    # Collect every pool size into one line collection and one scatter
+    segs, seg_colors, sc_x, sc_y, sc_c, handles = [], [], [], [], [], []
+    for (pool_size, g), color in zip(grouped, colors):
+        conc, tps = g['concurrency'].values, g['tps'].values
+        sc_x.append(conc)
+        sc_y.append(tps)
+        sc_c.append(np.broadcast_to(color, (len(conc), 4)))
         # Connect points with lines if there are multiple
         if len(conc) > 1:
-            ax.plot(conc, tps, c=colors[i], alpha=0.3, linewidth=1)
+            segs.append(np.column_stack([conc, tps]))
+            seg_colors.append(color)
+        handles.append(Line2D([], [], linestyle='', marker='o', markersize=7, color=color,
+                              alpha=0.7, label=f'pool={pool_size}'))
+
+    ax.add_collection(LineCollection(segs, colors=seg_colors, alpha=0.3, linewidths=1))
+    ax.scatter(np.concatenate(sc_x), np.concatenate(sc_y), c=np.concatenate(sc_c), s=50, alpha=0.7)
+
+    # Highlight best point
+    handles.append(ax.scatter([best_concurrency], [best_tps], c='red', s=200, zorder=10,
+                              marker='*', edgecolors='black', linewidths=1,
+                              label=f"Best: c={best_concurrency}, p={best_pool_size} ({best_tps:,.1f} TPS)"))
 
-# Highlight best point
-ax.scatter([best['concurrency']], [best['tps']], c='red', s=200, zorder=10,
-           marker='*', edgecolors='black', linewidths=1,
-           label=f"Best: c={best['concurrency']}, p={best['pool_size']} ({best['tps']:,.1f} TPS)")
+    # Formatting
+    ax.set_xlabel('Concurrency', fontsize=12)
+    ax.set_ylabel('Throughput (TPS)', fontsize=12)
+    ax.set_title(f'{title}: Concurrency vs Throughput by Pool Size', fontsize=14)
+    ax.set_xscale('log')
+    ax.grid(True, alpha=0.3)
+    ax.legend(handles=handles, loc='upper right', fontsize=9, ncol=2)
 
-# Formatting
-ax.set_xlabel('Concurrency', fontsize=12)
-ax.set_ylabel('Throughput (TPS)', fontsize=12)
-ax.set_title(f'{title}: Concurrency vs Throughput by Pool Size', fontsize=14)
-ax.set_xscale('log')
-ax.grid(True, alpha=0.3)
-ax.legend(loc='upper right', fontsize=9, ncol=2)
+    plt.savefig(output, dpi=150)
+    print(f"Graph saved to {output}")
+    print(f"Best: concurrency={best_concurrency}, pool_size={best_pool_size} with {best_tps:,.1f} TPS")
 
-plt.tight_layout()
-plt.savefig(output_file, dpi=150)
-print(f"Graph saved to {output_file}")
-print(f"Best: concurrency={best['concurrency']}, pool_size={best['pool_size']} with {best['tps']:,.1f} TPS")
+
+# Usage: ./plot_2d_results.py <csv_file> [title]
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print("Usage: ./plot_2d_results.py <csv_file> [title]")
+        sys.exit(1)
+    main(*sys.argv[1:])
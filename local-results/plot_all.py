@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Regenerate all local result charts in a single interpreter, so pandas and
+matplotlib are imported once rather than once per script
+"""
+
+import os
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+import plot_2d_results
+import plot_normal_comparison
+import plot_postgres_atomic_quick
+import plot_postgres_atomic_quick_fixed
+import plot_postgres_batched_quick
+import plot_postgres_standard_quick
+import plot_quick_results
+import plot_results
+
+PLOTS = [
+    lambda: plot_2d_results.main('2026-01-16-postgres-atomic.csv'),
+    lambda: plot_2d_results.main('2026-01-16-postgres-standard.csv'),
+    lambda: plot_normal_comparison.main([]),
+    plot_postgres_atomic_quick.main,
+    plot_postgres_atomic_quick_fixed.main,
+    plot_postgres_batched_quick.main,
+    plot_postgres_standard_quick.main,
+    plot_quick_results.main,
+    plot_results.main,
+]
+
+
+def main():
+    # The scripts read and write files relative to this directory
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    for plot in PLOTS:
+        plot()
+        plt.close('all')
+        print()
+
+
+if __name__ == '__main__':
+    main()
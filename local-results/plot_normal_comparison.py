@@ -3,57 +3,82 @@
 Plot bar chart comparing normal test results for winning configurations
 """
 
+import argparse
+
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import numpy as np
 
-# Read the data
-df = pd.read_csv('2026-01-19-normal-comparison.csv')
-
-# Filter out failed tests (error_rate > 0)
-df_success = df[df['error_rate'] == 0].copy()
-
-# Create labels with configuration details
-df_success['label'] = df_success.apply(
-    lambda row: f"{row['executor']}\n(conc: {row['concurrency']})",
-    axis=1
-)
-
-# Create the bar chart
-fig, ax = plt.subplots(figsize=(12, 6))
-
-x = np.arange(len(df_success))
-bars = ax.bar(x, df_success['tps'], color=['#2ecc71', '#3498db', '#e74c3c', '#f39c12'])
-
-# Add value labels on top of bars
-for i, (idx, row) in enumerate(df_success.iterrows()):
-    ax.text(i, row['tps'] + 1000, f"{row['tps']:.1f}",
-            ha='center', va='bottom', fontweight='bold')
-
-# Customize the chart
-ax.set_xlabel('Executor Configuration', fontsize=12, fontweight='bold')
-ax.set_ylabel('Throughput (TPS)', fontsize=12, fontweight='bold')
-ax.set_title('Database Performance Comparison - Full Test Results\n(300s measurement, 3 iterations)',
-             fontsize=14, fontweight='bold')
-ax.set_xticks(x)
-ax.set_xticklabels(df_success['label'])
-ax.grid(axis='y', alpha=0.3)
-
-plt.tight_layout()
-plt.savefig('2026-01-19-normal-comparison.png', dpi=300, bbox_inches='tight')
-print(f"Chart saved to 2026-01-19-normal-comparison.png")
-
-# Print summary statistics
-print("\n=== Summary Statistics ===")
-print(f"Winner: {df_success.iloc[0]['executor']} with {df_success.iloc[0]['tps']:.1f} TPS")
-print(f"\nPerformance comparison:")
-print(f"  TigerBeetle is {df_success.iloc[0]['tps'] / df_success.iloc[1]['tps']:.2f}x faster than PostgreSQL Batched")
-print(f"  TigerBeetle is {df_success.iloc[0]['tps'] / df_success.iloc[2]['tps']:.2f}x faster than PostgreSQL Standard")
-print(f"  TigerBeetle is {df_success.iloc[0]['tps'] / df_success.iloc[3]['tps']:.2f}x faster than PostgreSQL Atomic")
-print(f"\nPostgreSQL executor rankings:")
-print(f"  1. Batched: {df_success.iloc[1]['tps']:.1f} TPS (conc: {df_success.iloc[1]['concurrency']})")
-print(f"  2. Standard: {df_success.iloc[2]['tps']:.1f} TPS (conc: {df_success.iloc[2]['concurrency']})")
-print(f"  3. Atomic: {df_success.iloc[3]['tps']:.1f} TPS (conc: {df_success.iloc[3]['concurrency']})")
-print(f"\n  Batched is {df_success.iloc[1]['tps'] / df_success.iloc[2]['tps']:.2f}x faster than Standard")
-print(f"  Batched is {df_success.iloc[1]['tps'] / df_success.iloc[3]['tps']:.2f}x faster than Atomic")
-print(f"  Standard is {df_success.iloc[2]['tps'] / df_success.iloc[3]['tps']:.2f}x faster than Atomic")
+DEFAULT_CSV = '2026-01-19-normal-comparison.csv'
+DEFAULT_OUTPUT = '2026-01-19-normal-comparison.png'
+DEFAULT_COLORS = ['#2ecc71', '#3498db', '#e74c3c', '#f39c12']
+
+
+def plot(df, colors, output_path):
+    """Plot one bar per successful configuration and save it to output_path."""
+    # Filter out failed tests (error_rate > 0)
+    df_success = df[df['error_rate'] == 0].copy()
+
+    # Create labels with configuration details
+    df_success['label'] = (df_success['executor'].astype(str) + '\n(conc: '
+                           + df_success['concurrency'].astype(str) + ')')
+
+    # Create the bar chart, widening it for longer comparisons
+    fig, ax = plt.subplots(figsize=(max(12, 2 * len(df_success)), 6), layout='constrained')
+
+    x = np.arange(len(df_success))
+    bars = ax.bar(x, df_success['tps'], color=colors)
+
+    # Add value labels on top of bars
+    ax.bar_label(bars, labels=df_success['tps'].map('{:.1f}'.format).tolist(),
+                 padding=3, fontweight='bold')
+
+    # Customize the chart
+    ax.set_xlabel('Executor Configuration', fontsize=12, fontweight='bold')
+    ax.set_ylabel('Throughput (TPS)', fontsize=12, fontweight='bold')
+    ax.set_title('Database Performance Comparison - Full Test Results\n(300s measurement, 3 iterations)',
+                 fontsize=14, fontweight='bold')
+    ax.set_xticks(x)
+    ax.set_xticklabels(df_success['label'])
+    ax.grid(axis='y', alpha=0.3)
+
+    plt.savefig(output_path, dpi=200)
+    plt.close(fig)
+    print(f"Chart saved to {output_path}")
+
+    # Print summary statistics
+    rows = df_success[['executor', 'concurrency', 'tps']].to_dict('records')
+    print("\n=== Summary Statistics ===")
+    print(f"Winner: {rows[0]['executor']} with {rows[0]['tps']:.1f} TPS")
+    if len(df_success) >= 4:
+        print(f"\nPerformance comparison:")
+        print(f"  TigerBeetle is {rows[0]['tps'] / rows[1]['tps']:.2f}x faster than PostgreSQL Batched")
+        print(f"  TigerBeetle is {rows[0]['tps'] / rows[2]['tps']:.2f}x faster than PostgreSQL Standard")
+        print(f"  TigerBeetle is {rows[0]['tps'] / rows[3]['tps']:.2f}x faster than PostgreSQL Atomic")
+        print(f"\nPostgreSQL executor rankings:")
+        print(f"  1. Batched: {rows[1]['tps']:.1f} TPS (conc: {rows[1]['concurrency']})")
+        print(f"  2. Standard: {rows[2]['tps']:.1f} TPS (conc: {rows[2]['concurrency']})")
+        print(f"  3. Atomic: {rows[3]['tps']:.1f} TPS (conc: {rows[3]['concurrency']})")
+        print(f"\n  Batched is {rows[1]['tps'] / rows[2]['tps']:.2f}x faster than Standard")
+        print(f"  Batched is {rows[1]['tps'] / rows[3]['tps']:.2f}x faster than Atomic")
+        print(f"  Standard is {rows[2]['tps'] / rows[3]['tps']:.2f}x faster than Atomic")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('--csv', default=DEFAULT_CSV, help=f'input CSV (default: {DEFAULT_CSV})')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help=f'output PNG (default: {DEFAULT_OUTPUT})')
+    parser.add_argument('--colors', nargs='+', default=DEFAULT_COLORS, help='bar colors, in row order')
+    args = parser.parse_args(argv)
+
+    df = pd.read_csv(args.csv, usecols=['executor', 'concurrency', 'tps', 'error_rate'],
+                     dtype={'executor': 'category', 'concurrency': 'int32',
+                            'tps': 'float64', 'error_rate': 'float64'},
+                     engine='c')
+    plot(df, args.colors, args.output)
+
+
+if __name__ == '__main__':
+    main()
@@ -3,82 +3,97 @@
 Plot PostgreSQL Atomic quick test results (after bug fix)
 """
 
+import sys
+
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import numpy as np
 
-# Read the data
-df = pd.read_csv('2026-01-19-postgres-atomic-quick-fixed.csv')
-
-# Find the best configuration
-best_idx = df['tps'].idxmax()
-best_row = df.loc[best_idx]
-
-print("=== PostgreSQL Atomic Quick Test Results (Bug Fixed) ===")
-print(f"\nBest configuration:")
-print(f"  Pool size: {best_row['pool_size']}")
-print(f"  Concurrency: {best_row['concurrency']}")
-print(f"  Throughput: {best_row['tps']:.1f} TPS")
-print(f"  Error rate: {best_row['error_rate']}%")
-
-# Top 5 configurations
-print(f"\nTop 5 configurations:")
-top5 = df.nlargest(5, 'tps')
-for idx, (_, row) in enumerate(top5.iterrows(), 1):
-    print(f"  {idx}. Pool {int(row['pool_size'])}, Conc {int(row['concurrency'])}: {row['tps']:.1f} TPS")
-
-# Create heatmap
-fig, ax = plt.subplots(figsize=(12, 8))
-
-# Pivot data for heatmap
-pivot = df.pivot(index='pool_size', columns='concurrency', values='tps')
-
-# Create heatmap
-im = ax.imshow(pivot, cmap='YlOrRd', aspect='auto')
-
-# Set ticks and labels
-ax.set_xticks(np.arange(len(pivot.columns)))
-ax.set_yticks(np.arange(len(pivot.index)))
-ax.set_xticklabels(pivot.columns)
-ax.set_yticklabels(pivot.index)
-
-# Add colorbar
-cbar = plt.colorbar(im, ax=ax)
-cbar.set_label('Throughput (TPS)', rotation=270, labelpad=20, fontweight='bold')
-
-# Add text annotations
-for i in range(len(pivot.index)):
-    for j in range(len(pivot.columns)):
-        value = pivot.iloc[i, j]
-        if not np.isnan(value):
-            text = ax.text(j, i, f'{value:.0f}',
-                          ha="center", va="center", color="black", fontsize=9, fontweight='bold')
-
-ax.set_xlabel('Concurrency', fontsize=12, fontweight='bold')
-ax.set_ylabel('Connection Pool Size', fontsize=12, fontweight='bold')
-ax.set_title('PostgreSQL Atomic Executor Performance Heatmap (Bug Fixed)\nQuick Test Results',
-             fontsize=14, fontweight='bold')
-
-plt.tight_layout()
-plt.savefig('2026-01-19-postgres-atomic-quick-fixed.png', dpi=300, bbox_inches='tight')
-print(f"\nHeatmap saved to 2026-01-19-postgres-atomic-quick-fixed.png")
-
-# Create line plot by pool size
-fig, ax = plt.subplots(figsize=(10, 6))
-
-for pool_size in sorted(df['pool_size'].unique()):
-    pool_data = df[df['pool_size'] == pool_size].sort_values('concurrency')
-    ax.plot(pool_data['concurrency'], pool_data['tps'],
-            marker='o', label=f'Pool {int(pool_size)}', linewidth=2)
-
-ax.set_xlabel('Concurrency', fontsize=12, fontweight='bold')
-ax.set_ylabel('Throughput (TPS)', fontsize=12, fontweight='bold')
-ax.set_title('PostgreSQL Atomic: Throughput vs Concurrency (Bug Fixed)',
-             fontsize=14, fontweight='bold')
-ax.set_xscale('log', base=2)
-ax.grid(True, alpha=0.3)
-ax.legend(fontsize=10)
-
-plt.tight_layout()
-plt.savefig('2026-01-19-postgres-atomic-concurrency-lines.png', dpi=300, bbox_inches='tight')
-print(f"Line chart saved to 2026-01-19-postgres-atomic-concurrency-lines.png")
+
+def main(csv_path='2026-01-19-postgres-atomic-quick-fixed.csv',
+         output='2026-01-19-postgres-atomic-quick-fixed.png',
+         lines_output='2026-01-19-postgres-atomic-concurrency-lines.png'):
+    # Read the data
+    df = pd.read_csv(csv_path, usecols=['pool_size', 'concurrency', 'tps', 'error_rate'],
+                     dtype={'pool_size': 'int32', 'concurrency': 'int32',
+                            'tps': 'float64', 'error_rate': 'float64'},
+                     engine='c')
+
+    # Find the best configuration
+    best_idx = df['tps'].idxmax()
+
+    print("=== PostgreSQL Atomic Quick Test Results (Bug Fixed) ===")
+    print(f"\nBest configuration:")
+    print(f"  Pool size: {df.at[best_idx, 'pool_size']}")
+    print(f"  Concurrency: {df.at[best_idx, 'concurrency']}")
+    print(f"  Throughput: {df.at[best_idx, 'tps']:.1f} TPS")
+    print(f"  Error rate: {df.at[best_idx, 'error_rate']:g}%")
+
+    # Top 5 configurations
+    print(f"\nTop 5 configurations:")
+    top5 = df.nlargest(5, 'tps')
+    for idx, (_, row) in enumerate(top5.iterrows(), 1):
+        print(f"  {idx}. Pool {int(row['pool_size'])}, Conc {int(row['concurrency'])}: {row['tps']:.1f} TPS")
+
+    # Create heatmap
+    fig, ax = plt.subplots(figsize=(12, 8), layout='constrained')
+
+    # Pivot data for heatmap over the ordered sweep grid
+    grid = df.assign(
+        pool_size=pd.Categorical(df['pool_size'], categories=sorted(df['pool_size'].unique()), ordered=True),
+        concurrency=pd.Categorical(df['concurrency'], categories=sorted(df['concurrency'].unique()), ordered=True),
+    )
+    pivot = grid.pivot_table(index='pool_size', columns='concurrency', values='tps', observed=True)
+    arr = pivot.to_numpy()
+
+    # Create heatmap
+    im = ax.imshow(arr, cmap='YlOrRd', aspect='auto', interpolation='nearest')
+
+    # Set ticks and labels
+    ax.set_xticks(np.arange(len(pivot.columns)))
+    ax.set_yticks(np.arange(len(pivot.index)))
+    ax.set_xticklabels(pivot.columns)
+    ax.set_yticklabels(pivot.index)
+
+    # Add colorbar
+    cbar = plt.colorbar(im, ax=ax)
+    cbar.set_label('Throughput (TPS)', rotation=270, labelpad=20, fontweight='bold')
+
+    # Add text annotations for the cells that have a measurement
+    ii, jj = np.where(~np.isnan(arr))
+    for i, j, value in zip(ii.tolist(), jj.tolist(), arr[ii, jj].tolist()):
+        ax.text(j, i, f'{value:.0f}',
+                ha="center", va="center", color="black", fontsize=9, fontweight='bold')
+
+    ax.set_xlabel('Concurrency', fontsize=12, fontweight='bold')
+    ax.set_ylabel('Connection Pool Size', fontsize=12, fontweight='bold')
+    ax.set_title('PostgreSQL Atomic Executor Performance Heatmap (Bug Fixed)\nQuick Test Results',
+                 fontsize=14, fontweight='bold')
+
+    plt.savefig(output, dpi=300)
+    print(f"\nHeatmap saved to {output}")
+
+    # Create line plot by pool size
+    fig, ax = plt.subplots(figsize=(10, 6), layout='constrained')
+
+    df_sorted = df.sort_values(['pool_size', 'concurrency'])
+    for pool_size, pool_data in df_sorted.groupby('pool_size', sort=True):
+        ax.plot(pool_data['concurrency'].values, pool_data['tps'].values,
+                marker='o', label=f'Pool {int(pool_size)}', linewidth=2)
+
+    ax.set_xlabel('Concurrency', fontsize=12, fontweight='bold')
+    ax.set_ylabel('Throughput (TPS)', fontsize=12, fontweight='bold')
+    ax.set_title('PostgreSQL Atomic: Throughput vs Concurrency (Bug Fixed)',
+                 fontsize=14, fontweight='bold')
+    ax.set_xscale('log', base=2)
+    ax.grid(True, alpha=0.3)
+    ax.legend(fontsize=10)
+
+    plt.savefig(lines_output, dpi=150)
+    print(f"Line chart saved to {lines_output}")
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
@@ -1,32 +1,43 @@
 #!/usr/bin/env python3
+import sys
+
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
+import numpy as np
+
+
+def main(csv_path='2026-01-18-tigerbeetle.csv', output='concurrency_vs_tps.png'):
+    # Read the CSV data, sorted by concurrency for better visualization
+    df = pd.read_csv(csv_path, usecols=['concurrency', 'tps'],
+                     dtype={'concurrency': 'int32', 'tps': 'float64'},
+                     engine='c').sort_values('concurrency')
+    conc = df['concurrency'].values
+    tps = df['tps'].values
+
+    # Create the plot
+    plt.figure(figsize=(12, 7), layout='constrained')
+    plt.plot(conc, tps, marker='o', linewidth=2, markersize=8)
+    plt.xscale('log')
+    plt.xlabel('Concurrency', fontsize=12)
+    plt.ylabel('TPS (Transactions Per Second)', fontsize=12)
+    plt.title('TigerBeetle Performance: Concurrency vs TPS', fontsize=14, fontweight='bold')
+    plt.grid(True, alpha=0.3)
+
+    # Mark the optimal point
+    best_i = np.argmax(tps)
+    max_concurrency = int(conc[best_i])
+    max_tps = float(tps[best_i])
+    plt.plot(max_concurrency, max_tps, 'r*', markersize=20, label=f'Optimal: {int(max_concurrency)} concurrency @ {max_tps:.1f} TPS')
+
+    plt.legend(fontsize=11)
+    plt.savefig(output, dpi=150)
+    print(f"Graph saved to {output}")
+    print(f"\nOptimal configuration:")
+    print(f"  Concurrency: {int(max_concurrency)}")
+    print(f"  TPS: {max_tps:.1f}")
+
 
-# Read the CSV data
-df = pd.read_csv('2026-01-18-tigerbeetle.csv')
-
-# Sort by concurrency for better visualization
-df = df.sort_values('concurrency')
-
-# Create the plot
-plt.figure(figsize=(12, 7))
-plt.plot(df['concurrency'], df['tps'], marker='o', linewidth=2, markersize=8)
-plt.xscale('log')
-plt.xlabel('Concurrency', fontsize=12)
-plt.ylabel('TPS (Transactions Per Second)', fontsize=12)
-plt.title('TigerBeetle Performance: Concurrency vs TPS', fontsize=14, fontweight='bold')
-plt.grid(True, alpha=0.3)
-
-# Mark the optimal point
-max_idx = df['tps'].idxmax()
-max_concurrency = df.loc[max_idx, 'concurrency']
-max_tps = df.loc[max_idx, 'tps']
-plt.plot(max_concurrency, max_tps, 'r*', markersize=20, label=f'Optimal: {int(max_concurrency)} concurrency @ {max_tps:.1f} TPS')
-
-plt.legend(fontsize=11)
-plt.tight_layout()
-plt.savefig('concurrency_vs_tps.png', dpi=300, bbox_inches='tight')
-print(f"Graph saved to concurrency_vs_tps.png")
-print(f"\nOptimal configuration:")
-print(f"  Concurrency: {int(max_concurrency)}")
-print(f"  TPS: {max_tps:.1f}")
+if __name__ == '__main__':
+    main(*sys.argv[1:])